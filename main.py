@@ -4,16 +4,32 @@ Scans AWS resources across accounts/regions, validates required tags,
 and exports Prometheus-compatible metrics.
 """
 import argparse
+import asyncio
 import logging
 import sys
 from pathlib import Path
 
 import yaml
 
+try:
+    # libyaml binding (bundled with PyYAML wheels), ~10x faster than pure Python
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.aws_audit import validate_resource_tags
-from src.metrics import update_metrics, expose_prometheus_metrics
+from src.aws_audit import (
+    DEFAULT_ASYNC_CONCURRENCY,
+    DEFAULT_MAX_WORKERS,
+    validate_resource_tags,
+    validate_resource_tags_async,
+)
+from src.metrics import (
+    DEFAULT_DETAIL_CARDINALITY_LIMIT,
+    expose_prometheus_metrics,
+    update_metrics,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,14 +37,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_BAR = "=" * 80
+
 
 def load_config(config_path: str = "config.yaml") -> dict:
     """Load configuration from YAML file."""
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
-def scan_and_export_metrics(config_path: str = "config.yaml", output_file: str = None):
+def scan_and_export_metrics(
+    config_path: str = "config.yaml",
+    output_file: str = None,
+    max_workers: int = None,
+    async_scan: bool = None
+):
     """Execute scan and export Prometheus metrics."""
     logger.info("Loading configuration from %s", config_path)
     cfg = load_config(config_path)
@@ -38,59 +61,77 @@ def scan_and_export_metrics(config_path: str = "config.yaml", output_file: str =
     assume_template = cfg.get('assume_role_name_template')
     overrides = cfg.get('aws_account_overrides', {})
     excluded_types = cfg.get('excluded_resource_types', [])
+    keep_records = cfg.get('keep_records_in_memory', False)
+    type_filters = cfg.get('resource_type_filters', [])
+    if max_workers is None:
+        max_workers = cfg.get('max_workers', DEFAULT_MAX_WORKERS)
+    if async_scan is None:
+        async_scan = cfg.get('async_scan', False)
+    async_concurrency = cfg.get('async_max_concurrency', DEFAULT_ASYNC_CONCURRENCY)
 
     logger.info("Starting AWS resource scan across %d accounts", len(matrix))
     logger.info("Required tags: %s", required_tags)
     if excluded_types:
         logger.info("Excluded resource types: %s", excluded_types)
 
-    results = validate_resource_tags(
-        matrix, required_tags, assume_template, overrides, excluded_types
-    )
+    if async_scan:
+        results = asyncio.run(validate_resource_tags_async(
+            matrix, required_tags, assume_template, overrides, excluded_types,
+            keep_records=keep_records, resource_type_filters=type_filters,
+            max_concurrency=async_concurrency
+        ))
+    else:
+        results = validate_resource_tags(
+            matrix, required_tags, assume_template, overrides, excluded_types, max_workers,
+            keep_records, type_filters
+        )
 
     logger.info("Updating Prometheus metrics")
-    update_metrics(results)
+    update_metrics(
+        results, cfg.get('detail_cardinality_limit', DEFAULT_DETAIL_CARDINALITY_LIMIT)
+    )
 
     _print_summary(results)
 
+    payload = expose_prometheus_metrics().body
+
     if output_file:
-        metrics_data = expose_prometheus_metrics()
         with open(output_file, 'wb') as f:
-            f.write(metrics_data.body)
+            f.write(payload)
         logger.info("Metrics exported to %s", output_file)
     else:
-        print("\n" + "="*80)
-        print("PROMETHEUS METRICS")
-        print("="*80)
-        metrics_data = expose_prometheus_metrics()
-        print(metrics_data.body.decode('utf-8'))
+        sys.stdout.write(f"\n{_BAR}\nPROMETHEUS METRICS\n{_BAR}\n")
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
 
     return results
 
 
 def _print_summary(results: dict):
-    """Print scan summary to console."""
-    print("\n" + "="*80)
-    print("SCAN SUMMARY")
-    print("="*80)
+    """Print scan summary to console in a single write."""
+    lines = ["", _BAR, "SCAN SUMMARY", _BAR]
 
     for account_id, acct in results.items():
         if "error" in acct:
-            print(f"\nAccount: {acct.get('account_name')} ({account_id}) - ERROR: {acct['error']}")
+            lines.append(f"\nAccount: {acct.get('account_name')} ({account_id}) - ERROR: {acct['error']}")
             continue
 
         acct_name = acct.get('account_name')
-        print(f"\nAccount: {acct_name} ({account_id})")
+        lines.append(f"\nAccount: {acct_name} ({account_id})")
 
         for region, data in acct.get('regions', {}).items():
             total = data.get('total', 0)
-            compliant = len(data.get('compliant', []))
-            non_compliant = len(data.get('non_compliant', []))
+            compliant = data['compliant_count']
+            non_compliant = data['non_compliant_count']
             compliance_pct = (compliant / total * 100) if total > 0 else 0
 
-            print(f"  Region: {region}")
-            print(f"    Total: {total} | Compliant: {compliant} | "
-                  f"Non-Compliant: {non_compliant} | Compliance: {compliance_pct:.1f}%")
+            lines.append(f"  Region: {region}")
+            lines.append(f"    Total: {total} | Compliant: {compliant} | "
+                         f"Non-Compliant: {non_compliant} | Compliance: {compliance_pct:.1f}%")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -113,6 +154,12 @@ Examples:
 
   # Web mode with custom settings
   python main.py --web --port 9090 --refresh-interval 600
+
+  # Limit concurrent region scans
+  python main.py --max-workers 4
+
+  # Scan with aioboto3 instead of a thread pool
+  python main.py --async-scan
         """
     )
 
@@ -147,6 +194,18 @@ Examples:
         default=None,
         help='Seconds between metric refreshes in web mode (overrides config.yaml, default: 300)'
     )
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=None,
+        help=f'Regions scanned concurrently (overrides config.yaml, default: {DEFAULT_MAX_WORKERS})'
+    )
+    parser.add_argument(
+        '--async-scan',
+        action='store_true',
+        default=None,
+        help='Scan with aioboto3 on a single event loop instead of a thread pool'
+    )
 
     args = parser.parse_args()
 
@@ -159,6 +218,10 @@ Examples:
 
             # Get refresh_interval from config, allow CLI to override
             refresh_interval = args.refresh_interval if args.refresh_interval is not None else cfg.get('refresh_interval', 300)
+            if args.max_workers is not None:
+                cfg['max_workers'] = args.max_workers
+            if args.async_scan:
+                cfg['async_scan'] = True
 
             run_web_server(
                 config=cfg,
@@ -168,7 +231,7 @@ Examples:
             )
         else:
             # CLI mode (original behavior)
-            scan_and_export_metrics(args.config, args.output)
+            scan_and_export_metrics(args.config, args.output, args.max_workers, args.async_scan)
     except Exception as e:
         logger.error("Failed: %s", e, exc_info=True)
         sys.exit(1)
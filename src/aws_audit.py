@@ -3,24 +3,112 @@
 Uses AWS Resource Groups Tagging API for cross-account resource discovery
 and tag compliance validation.
 """
+import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
 import boto3
+import botocore.session
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_WORKERS = 16
+# In-flight AssumeRole/region scans for validate_resource_tags_async()
+DEFAULT_ASYNC_CONCURRENCY = 64
+
+# GetResources rejects ResourcesPerPage above 100
+RESOURCES_PER_PAGE = 100
+
+_CLIENT_CONFIG = Config(
+    retries={"max_attempts": 5, "mode": "standard"},
+    connect_timeout=10,
+    read_timeout=60
+)
+
+# AssumeRole is throttled per account and endpoint: back off adaptively, and
+# call the STS endpoint of the session region (fallback below) rather than
+# the global one (see _pin_sts_regional())
+_STS_CONFIG = Config(
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    connect_timeout=10,
+    read_timeout=30
+)
+_STS_FALLBACK_REGION = "us-east-1"
+
+
+def _pin_sts_regional(botocore_session):
+    """Resolve STS to its regional endpoint on every botocore release.
+
+    Older botocore defaults sts_regional_endpoints to "legacy", which maps
+    us-east-1 (among others) to the global sts.amazonaws.com.
+    """
+    botocore_session.set_config_variable("sts_regional_endpoints", "regional")
+    return botocore_session
+
+
+# Shared session: service models and endpoint data are loaded once per process.
+# Sessions are not thread-safe, so client creation is serialized.
+_session = boto3.session.Session(
+    botocore_session=_pin_sts_regional(botocore.session.get_session())
+)
+_session_lock = threading.Lock()
+
+# Tagging clients by (region, sorted credential items), pruned after each scan
+_TaggingClientKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+_tagging_clients: Dict[_TaggingClientKey, Any] = {}
+
+# Assumed-role credentials by role ARN -> (credentials, expiry)
+ROLE_SESSION_SECONDS = 3600
+_CREDS_REFRESH_MARGIN = timedelta(minutes=5)
+_creds_cache: Dict[str, Tuple[Dict[str, str], datetime]] = {}
+_creds_lock = threading.Lock()
+
 
 def _assume_role(sts_client, role_arn: str, session_name: str = "tag-audit") -> Dict[str, str]:
-    """Assume IAM role and return temporary credentials."""
+    """Assume IAM role and return temporary credentials (cached until near expiry)."""
+    creds = _get_cached_credentials(role_arn)
+    if creds:
+        return creds
+
+    fallback_expiry = datetime.now(timezone.utc) + timedelta(seconds=ROLE_SESSION_SECONDS)
     resp = sts_client.assume_role(
         RoleArn=role_arn,
         RoleSessionName=session_name,
-        DurationSeconds=3600
+        DurationSeconds=ROLE_SESSION_SECONDS
     )
-    creds = resp["Credentials"]
+    creds = _client_credentials(resp["Credentials"])
+    _cache_credentials(role_arn, creds, resp["Credentials"].get("Expiration", fallback_expiry))
+    return creds
+
+
+def _get_cached_credentials(role_arn: str) -> Optional[Dict[str, str]]:
+    """Return cached credentials for role if valid beyond the refresh margin."""
+    with _creds_lock:
+        cached = _creds_cache.get(role_arn)
+    if cached and cached[1] - datetime.now(timezone.utc) > _CREDS_REFRESH_MARGIN:
+        logger.debug("Reusing cached credentials for %s", role_arn)
+        return cached[0]
+    return None
+
+
+def _cache_credentials(role_arn: str, creds: Dict[str, str], expiry: datetime):
+    """Store assumed-role credentials with their expiry.
+
+    Expiry is the STS-reported Expiration; the requested duration is only a fallback.
+    """
+    with _creds_lock:
+        _creds_cache[role_arn] = (creds, expiry)
+
+
+def _client_credentials(creds: Dict[str, Any]) -> Dict[str, str]:
+    """Convert STS credentials to client keyword arguments."""
     return {
         "aws_access_key_id": creds["AccessKeyId"],
         "aws_secret_access_key": creds["SecretAccessKey"],
@@ -28,22 +116,52 @@ def _assume_role(sts_client, role_arn: str, session_name: str = "tag-audit") ->
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _get_sts_client():
+    """Get base-credentials regional STS client (created once per process)."""
+    with _session_lock:
+        return _session.client("sts", **_sts_client_kwargs())
+
+
+def _sts_client_kwargs(config: Optional[Config] = None) -> Dict[str, Any]:
+    """Client arguments pinning STS to a regional endpoint."""
+    return {
+        "region_name": _session.region_name or _STS_FALLBACK_REGION,
+        "config": _STS_CONFIG.merge(config) if config else _STS_CONFIG,
+    }
+
+
+def _tagging_client_key(region: str, creds: Optional[Dict[str, str]]) -> _TaggingClientKey:
+    """Cache key of the tagging client for (region, credentials)."""
+    return region, tuple(sorted(creds.items())) if creds else ()
+
+
 def _get_tagging_client(region: str, creds: Optional[Dict[str, str]] = None):
-    """Create Resource Groups Tagging API client."""
-    config = Config(
-        retries={"max_attempts": 5, "mode": "standard"},
-        connect_timeout=10,
-        read_timeout=60
-    )
-    kwargs = {"region_name": region, "config": config}
-    if creds:
-        kwargs.update(**creds)
-    return boto3.client("resourcegroupstaggingapi", **kwargs)
+    """Get Resource Groups Tagging API client, reused per (region, credentials).
 
+    Created from the shared session on first use; see _retain_tagging_clients()
+    for eviction.
+    """
+    key = _tagging_client_key(region, creds)
+    with _session_lock:
+        client = _tagging_clients.get(key)
+        if client is None:
+            client = _session.client(
+                "resourcegroupstaggingapi", region_name=region, config=_CLIENT_CONFIG, **dict(key[1])
+            )
+            _tagging_clients[key] = client
+        return client
 
-def _extract_tags(tag_list: List[Dict[str, str]]) -> Dict[str, str]:
-    """Convert AWS tag list format to dict."""
-    return {tag["Key"]: tag.get("Value", "") for tag in tag_list}
+
+def _retain_tagging_clients(keys: Set[_TaggingClientKey]):
+    """Drop cached tagging clients not used by the latest scan.
+
+    Keeps exactly the current (region, credentials) jobs for reuse by the next
+    scan; clients for rotated credentials or removed accounts/regions are released.
+    """
+    with _session_lock:
+        for key in _tagging_clients.keys() - keys:
+            del _tagging_clients[key]
 
 
 def _parse_resource_arn(arn: str) -> Tuple[str, str]:
@@ -51,49 +169,62 @@ def _parse_resource_arn(arn: str) -> Tuple[str, str]:
 
     ARN format: arn:partition:service:region:account:resource
     Returns: (service, resource_type)
+
+    Typed ARNs (".../instance/i-0abc") are parsed once per prefix up to the first
+    "/", which every resource of that type shares. Untyped ARNs use the service.
     """
-    if not arn or ":" not in arn:
-        return "unknown", "unknown"
+    prefix, slash, _ = arn.partition("/")
+    if slash:
+        return _parse_arn_prefix(prefix)
 
-    try:
-        parts = arn.split(":", 5)
-        service = parts[2] if len(parts) > 2 else "unknown"
-        resource_part = parts[5] if len(parts) > 5 else ""
-        resource_type = resource_part.split("/")[0] if "/" in resource_part else service
-        return service, resource_type
-    except Exception as e:
-        logger.warning("Failed to parse ARN %s: %s", arn, e)
-        return "unknown", "unknown"
+    parts = arn.split(":", 3)
+    service = parts[2] if len(parts) > 2 else "unknown"
+    return service, service
 
 
-def _is_excluded(resource_type: str, exclusion_patterns: List[str]) -> bool:
-    """Check if resource type matches any exclusion pattern.
+@functools.lru_cache(maxsize=2048)
+def _parse_arn_prefix(prefix: str) -> Tuple[str, str]:
+    """Parse (service, resource_type) from ARN prefix before the first "/"."""
+    parts = prefix.split(":", 5)
+    service = parts[2] if len(parts) > 2 else "unknown"
+    resource_type = parts[5] if len(parts) > 5 else service
+    return service, resource_type
+
+
+def _compile_exclusions(exclusion_patterns: Optional[List[str]]) -> Tuple[str, ...]:
+    """Normalize exclusion patterns once per scan for _is_excluded().
 
     Supports:
     - Exact match: "pod"
     - Substring match: pattern in resource_type
     - Service prefix: "ecs:task" matches "task" for ECS service
     - Wildcard: "eks:*" matches all resource types containing "eks:"
+
+    Every form reduces to a case-insensitive substring test, so patterns are
+    lowercased with "*" stripped.
     """
-    if not exclusion_patterns:
+    return tuple(pattern.lower().replace("*", "") for pattern in exclusion_patterns or ())
+
+
+def _is_excluded(resource_type: str, exclusions: Tuple[str, ...]) -> bool:
+    """Check if resource type matches any compiled exclusion pattern."""
+    if not exclusions:
         return False
 
     resource_type_lower = resource_type.lower()
+    for pattern in exclusions:
+        if pattern in resource_type_lower:
+            return True
+    return False
 
-    for pattern in exclusion_patterns:
-        pattern_lower = pattern.lower()
-
-        # Wildcard match (e.g., "eks:*")
-        if "*" in pattern_lower:
-            prefix = pattern_lower.replace("*", "")
-            if prefix in resource_type_lower:
-                return True
 
-        # Exact or substring match
-        elif pattern_lower in resource_type_lower:
-            return True
+def _required_tag_names(required_tags: List[str]) -> Tuple[str, ...]:
+    """Deduplicate required tags, keeping config order.
 
-    return False
+    Names are converted to str: YAML reads unquoted entries such as 2024 or
+    on as int/bool, while tag keys and metric labels are strings.
+    """
+    return tuple(dict.fromkeys(map(str, required_tags)))
 
 
 def validate_resource_tags(
@@ -102,26 +233,40 @@ def validate_resource_tags(
     assume_role_name_template: Optional[str] = None,
     account_overrides: Optional[Dict[str, Dict[str, str]]] = None,
     excluded_resource_types: Optional[List[str]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    keep_records: bool = False,
+    resource_type_filters: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """Validate tags across AWS accounts and regions.
 
+    Credentials are obtained serially per account; (account, region) scans
+    then run concurrently in a thread pool.
+
     Args:
         aws_account_matrix: List of account configurations with account_id, account_name, regions
         required_tags: List of required tag names
         assume_role_name_template: Role name template with {account_id} placeholder
         account_overrides: Account-specific role ARN overrides
         excluded_resource_types: List of resource type patterns to exclude (supports wildcards)
+        max_workers: Maximum number of regions scanned concurrently
+        keep_records: Retain full records for compliant resources (counters only otherwise)
+        resource_type_filters: Server-side allow-list ("service[:type]") passed to GetResources
 
     Returns:
         Dict[account_id -> {account_name, regions -> {compliant, non_compliant, total, errors}}]
     """
     results = {}
     account_overrides = account_overrides or {}
-    excluded_resource_types = excluded_resource_types or []
-    base_sts = boto3.client("sts")
+    exclusions = _compile_exclusions(excluded_resource_types)
+    required = _required_tag_names(required_tags)
+    paginate_kwargs = _paginate_kwargs(resource_type_filters)
+    base_sts = _get_sts_client()
+    scan_jobs = []
 
-    if excluded_resource_types:
+    if exclusions:
         logger.info("Excluding resource types: %s", excluded_resource_types)
+    if resource_type_filters:
+        logger.info("Restricting scan to resource types: %s", resource_type_filters)
 
     for acct in aws_account_matrix:
         account_id = acct["account_id"]
@@ -144,19 +289,34 @@ def validate_resource_tags(
             }
             continue
 
-        account_result = {
+        results[account_id] = {
             "account_id": account_id,
             "account_name": account_name,
             "regions": {}
         }
+        scan_jobs.extend((account_id, account_name, region, creds) for region in regions)
+
+    region_results = {}
+    if scan_jobs:
+        logger.info("Scanning %d regions with %d workers", len(scan_jobs), max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tag-scan") as executor:
+            futures = {
+                executor.submit(
+                    _scan_region, region, creds, required,
+                    account_id, account_name, exclusions, keep_records,
+                    paginate_kwargs
+                ): (account_id, region)
+                for account_id, account_name, region, creds in scan_jobs
+            }
+            for future in as_completed(futures):
+                region_results[futures[future]] = future.result()
+    _retain_tagging_clients({
+        _tagging_client_key(region, creds) for _, _, region, creds in scan_jobs
+    })
 
-        for region in regions:
-            logger.info("Scanning region: %s", region)
-            account_result["regions"][region] = _scan_region(
-                region, creds, required_tags, account_id, account_name, excluded_resource_types
-            )
-
-        results[account_id] = account_result
+    # Assemble in config order regardless of completion order
+    for account_id, _, region, _ in scan_jobs:
+        results[account_id]["regions"][region] = region_results[(account_id, region)]
 
     logger.info("="*60)
     logger.info("Scan complete: %d accounts", len(results))
@@ -165,20 +325,29 @@ def validate_resource_tags(
     return results
 
 
-def _get_account_credentials(
-    sts_client,
+def _resolve_role_arn(
     account_id: str,
     assume_role_template: Optional[str],
     overrides: Dict[str, Dict[str, str]]
-) -> Optional[Dict[str, str]]:
-    """Get credentials for account via role assumption."""
-    override = overrides.get(account_id, {})
-    role_arn = override.get("role_arn")
+) -> Optional[str]:
+    """Resolve role ARN from account override or name template."""
+    role_arn = overrides.get(account_id, {}).get("role_arn")
 
     if not role_arn and assume_role_template:
         role_name = assume_role_template.format(account_id=account_id)
         role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
 
+    return role_arn
+
+
+def _get_account_credentials(
+    sts_client,
+    account_id: str,
+    assume_role_template: Optional[str],
+    overrides: Dict[str, Dict[str, str]]
+) -> Optional[Dict[str, str]]:
+    """Get credentials for account via role assumption."""
+    role_arn = _resolve_role_arn(account_id, assume_role_template, overrides)
     if not role_arn:
         return None
 
@@ -193,44 +362,29 @@ def _get_account_credentials(
 def _scan_region(
     region: str,
     creds: Dict[str, str],
-    required_tags: List[str],
+    required: Tuple[str, ...],
     account_id: str,
     account_name: str,
-    excluded_resource_types: List[str]
+    exclusions: Tuple[str, ...],
+    keep_records: bool = False,
+    paginate_kwargs: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """Scan single region for tag compliance."""
-    result = {"compliant": [], "non_compliant": [], "total": 0, "excluded": 0, "errors": []}
+    result = _new_region_result()
+    logger.info("Scanning region: %s (%s)", region, account_name)
 
     try:
         client = _get_tagging_client(region, creds)
         paginator = client.get_paginator("get_resources")
 
-        for page_num, page in enumerate(paginator.paginate(ResourcesPerPage=100), 1):
-            resources = page.get("ResourceTagMappingList", [])
-            logger.debug("Processing page %d: %d resources", page_num, len(resources))
-
-            for resource in resources:
-                arn = resource.get("ResourceARN", "")
-                _, resource_type = _parse_resource_arn(arn)
-
-                # Check if resource type is excluded
-                if _is_excluded(resource_type, excluded_resource_types):
-                    result["excluded"] += 1
-                    logger.debug("Excluding resource: %s (type: %s)", arn, resource_type)
-                    continue
+        pages = paginator.paginate(**(paginate_kwargs or _paginate_kwargs()))
+        for page_num, page in enumerate(pages, 1):
+            _process_page(
+                result, page, page_num, required,
+                account_id, account_name, region, exclusions, keep_records
+            )
 
-                result["total"] += 1
-                record = _validate_resource(
-                    resource, required_tags, account_id, account_name, region
-                )
-                target = result["non_compliant"] if record["missing_tags"] else result["compliant"]
-                target.append(record)
-
-        logger.info(
-            "Region %s: %d scanned, %d compliant, %d non-compliant, %d excluded",
-            region, result["total"], len(result["compliant"]),
-            len(result["non_compliant"]), result["excluded"]
-        )
+        _log_region_result(result, account_name, region)
 
     except ClientError as e:
         error_msg = f"AWS API error in {region}: {e}"
@@ -244,29 +398,326 @@ def _scan_region(
     return result
 
 
-def _validate_resource(
-    resource: Dict[str, Any],
+def _paginate_kwargs(resource_type_filters: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Build GetResources pagination arguments."""
+    kwargs = {"ResourcesPerPage": RESOURCES_PER_PAGE}
+    if resource_type_filters:
+        kwargs["ResourceTypeFilters"] = list(resource_type_filters)
+    return kwargs
+
+
+class ResourceRecord(NamedTuple):
+    """Validated resource (one per non-compliant resource, or any with full records)."""
+
+    account_id: str
+    account_name: str
+    region: str
+    resource_arn: str
+    resource_type: str
+    service: str
+    present_tags: List[str]
+    missing_tags: List[str]
+    raw_tags: Optional[Dict[str, str]] = None
+
+
+def _new_region_result() -> Dict[str, Any]:
+    """Create empty region scan result.
+
+    Compliant resources are tracked by counters; records for them are kept in
+    "compliant" only on request. Non-compliant records are always kept (without
+    raw_tags unless full records are requested). Per-tag counters cover all
+    resources, so metrics need not re-aggregate records.
+    """
+    return {
+        "compliant": [],
+        "non_compliant": [],
+        "total": 0,
+        "excluded": 0,
+        "errors": [],
+        "compliant_count": 0,
+        "non_compliant_count": 0,
+        "compliant_by_type": Counter(),
+        "non_compliant_by_type": Counter(),
+        "tag_present_counts": Counter(),
+        "tag_missing_counts": Counter(),
+        "tag_type_present_counts": Counter(),
+    }
+
+
+def _process_page(
+    result: Dict[str, Any],
+    page: Dict[str, Any],
+    page_num: int,
+    required: Tuple[str, ...],
+    account_id: str,
+    account_name: str,
+    region: str,
+    exclusions: Tuple[str, ...],
+    keep_records: bool = False
+):
+    """Validate one GetResources page into region result.
+
+    Tag extraction is inlined: this loop runs once per resource. Present and
+    missing tags keep the order of required (see _required_tag_names()).
+    """
+    resources = page.get("ResourceTagMappingList", [])
+    logger.debug("Processing page %d: %d resources", page_num, len(resources))
+
+    compliant_append = result["compliant"].append if keep_records else None
+    non_compliant_append = result["non_compliant"].append
+    compliant_by_type = result["compliant_by_type"]
+    tag_present_counts = result["tag_present_counts"]
+    tag_missing_counts = result["tag_missing_counts"]
+    non_compliant_by_type = result["non_compliant_by_type"]
+    tag_type_present_counts = result["tag_type_present_counts"]
+    required_set = frozenset(required)
+    total = excluded = compliant = 0
+
+    for resource in resources:
+        arn = resource.get("ResourceARN") or ""
+        service, resource_type = _parse_resource_arn(arn)
+
+        # Check if resource type is excluded (no call when there are no patterns)
+        if exclusions and _is_excluded(resource_type, exclusions):
+            excluded += 1
+            logger.debug("Excluding resource: %s (type: %s)", arn, resource_type)
+            continue
+
+        total += 1
+        # Values are only needed for raw_tags in full records
+        if keep_records:
+            tags = {tag["Key"]: tag.get("Value", "") for tag in resource.get("Tags") or ()}
+            tag_keys = tags.keys()
+        else:
+            tags = None
+            tag_keys = {tag["Key"] for tag in resource.get("Tags") or ()}
+
+        # Subset test allocates nothing; lists are only built for non-compliant resources
+        if tag_keys >= required_set:
+            compliant += 1
+            compliant_by_type[resource_type] += 1
+            if compliant_append is None:
+                continue
+            present, missing = list(required), []
+        else:
+            present, missing = [], []
+            for tag in required:
+                (present if tag in tag_keys else missing).append(tag)
+
+        record = ResourceRecord(
+            account_id, account_name, region, arn, resource_type, service,
+            present, missing, tags
+        )
+        if missing:
+            non_compliant_append(record)
+            tag_present_counts.update(present)
+            tag_missing_counts.update(missing)
+            non_compliant_by_type[resource_type] += 1
+            for tag in present:
+                tag_type_present_counts[tag, resource_type] += 1
+        else:
+            compliant_append(record)
+
+    # Compliant resources carry every required tag
+    if compliant:
+        for tag in required:
+            tag_present_counts[tag] += compliant
+
+    result["total"] += total
+    result["excluded"] += excluded
+    result["compliant_count"] += compliant
+    result["non_compliant_count"] += total - compliant
+
+
+def _log_region_result(result: Dict[str, Any], account_name: str, region: str):
+    """Log region scan totals."""
+    logger.info(
+        "%s/%s: %d scanned, %d compliant, %d non-compliant, %d excluded",
+        account_name, region, result["total"], result["compliant_count"],
+        result["non_compliant_count"], result["excluded"]
+    )
+
+
+async def validate_resource_tags_async(
+    aws_account_matrix: List[Dict[str, Any]],
     required_tags: List[str],
+    assume_role_name_template: Optional[str] = None,
+    account_overrides: Optional[Dict[str, Dict[str, str]]] = None,
+    excluded_resource_types: Optional[List[str]] = None,
+    keep_records: bool = False,
+    resource_type_filters: Optional[List[str]] = None,
+    max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Async variant of validate_resource_tags() built on aioboto3.
+
+    Role assumption for all accounts and every (account, region) scan run
+    concurrently on the event loop, at most max_concurrency at a time to stay
+    within STS and tagging API throttles. Same result shape.
+    """
+    import aioboto3
+    from aiobotocore.session import get_session
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+
+    account_overrides = account_overrides or {}
+    exclusions = _compile_exclusions(excluded_resource_types)
+    required = _required_tag_names(required_tags)
+    paginate_kwargs = _paginate_kwargs(resource_type_filters)
+    session = aioboto3.Session(botocore_session=_pin_sts_regional(get_session()))
+
+    if exclusions:
+        logger.info("Excluding resource types: %s", excluded_resource_types)
+    if resource_type_filters:
+        logger.info("Restricting scan to resource types: %s", resource_type_filters)
+
+    accounts = [
+        (acct["account_id"], acct.get("account_name", acct["account_id"]),
+         acct.get("regions") or ["us-east-1"])
+        for acct in aws_account_matrix
+    ]
+
+    sts_kwargs = _sts_client_kwargs(Config(max_pool_connections=max_concurrency))
+    async with session.client("sts", **sts_kwargs) as sts:
+        account_creds = await asyncio.gather(*(
+            bounded(_a_get_account_credentials(
+                sts, account_id, assume_role_name_template, account_overrides
+            ))
+            for account_id, _, _ in accounts
+        ))
+
+    results = {}
+    scan_jobs = []
+    for (account_id, account_name, regions), creds in zip(accounts, account_creds):
+        if creds is None:
+            results[account_id] = {
+                "account_id": account_id,
+                "account_name": account_name,
+                "error": "Failed to obtain credentials",
+                "regions": {}
+            }
+            continue
+
+        results[account_id] = {
+            "account_id": account_id,
+            "account_name": account_name,
+            "regions": {}
+        }
+        scan_jobs.extend((account_id, account_name, region, creds) for region in regions)
+
+    logger.info("Scanning %d regions (up to %d concurrently)", len(scan_jobs), max_concurrency)
+    region_results = await asyncio.gather(
+        *(
+            bounded(_a_scan_region(
+                session, region, creds, required,
+                account_id, account_name, exclusions, keep_records,
+                paginate_kwargs
+            ))
+            for account_id, account_name, region, creds in scan_jobs
+        ),
+        return_exceptions=True
+    )
+
+    for (account_id, _, region, _), region_result in zip(scan_jobs, region_results):
+        if isinstance(region_result, BaseException):
+            error_msg = f"Unexpected error in {region}: {region_result}"
+            logger.error(error_msg)
+            region_result = _new_region_result()
+            region_result["errors"].append(error_msg)
+        results[account_id]["regions"][region] = region_result
+
+    logger.info("="*60)
+    logger.info("Scan complete: %d accounts", len(results))
+    logger.info("="*60)
+
+    return results
+
+
+async def _a_assume_role(sts_client, role_arn: str, session_name: str = "tag-audit") -> Dict[str, str]:
+    """Assume IAM role with async STS client (shares the credential cache)."""
+    creds = _get_cached_credentials(role_arn)
+    if creds:
+        return creds
+
+    fallback_expiry = datetime.now(timezone.utc) + timedelta(seconds=ROLE_SESSION_SECONDS)
+    resp = await sts_client.assume_role(
+        RoleArn=role_arn,
+        RoleSessionName=session_name,
+        DurationSeconds=ROLE_SESSION_SECONDS
+    )
+    creds = _client_credentials(resp["Credentials"])
+    _cache_credentials(role_arn, creds, resp["Credentials"].get("Expiration", fallback_expiry))
+    return creds
+
+
+async def _a_get_account_credentials(
+    sts_client,
+    account_id: str,
+    assume_role_template: Optional[str],
+    overrides: Dict[str, Dict[str, str]]
+) -> Optional[Dict[str, str]]:
+    """Get credentials for account via async role assumption."""
+    role_arn = _resolve_role_arn(account_id, assume_role_template, overrides)
+    if not role_arn:
+        return None
+
+    try:
+        logger.info("Assuming role: %s", role_arn)
+        return await _a_assume_role(sts_client, role_arn, session_name=f"audit-{account_id}")
+    except ClientError as e:
+        logger.error("Failed to assume role %s: %s", role_arn, e)
+        return None
+
+
+def _a_get_tagging_client(session, region: str, creds: Optional[Dict[str, str]] = None):
+    """Create async Resource Groups Tagging API client context manager.
+
+    Must be entered with `async with` by the caller for the whole scan.
+    """
+    kwargs = {"region_name": region, "config": _CLIENT_CONFIG}
+    if creds:
+        kwargs.update(**creds)
+    return session.client("resourcegroupstaggingapi", **kwargs)
+
+
+async def _a_scan_region(
+    session,
+    region: str,
+    creds: Dict[str, str],
+    required: Tuple[str, ...],
     account_id: str,
     account_name: str,
-    region: str
+    exclusions: Tuple[str, ...],
+    keep_records: bool = False,
+    paginate_kwargs: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
-    """Validate single resource against required tags."""
-    arn = resource.get("ResourceARN", "")
-    service, resource_type = _parse_resource_arn(arn)
-    tags = _extract_tags(resource.get("Tags", []))
+    """Scan single region for tag compliance with async client."""
+    result = _new_region_result()
+    logger.info("Scanning region: %s (%s)", region, account_name)
 
-    present = [tag for tag in required_tags if tag in tags]
-    missing = [tag for tag in required_tags if tag not in tags]
+    try:
+        async with _a_get_tagging_client(session, region, creds) as client:
+            paginator = client.get_paginator("get_resources")
+            page_num = 0
+            async for page in paginator.paginate(**(paginate_kwargs or _paginate_kwargs())):
+                page_num += 1
+                _process_page(
+                    result, page, page_num, required,
+                    account_id, account_name, region, exclusions, keep_records
+                )
 
-    return {
-        "account_id": account_id,
-        "account_name": account_name,
-        "region": region,
-        "resource_arn": arn,
-        "resource_type": resource_type,
-        "service": service,
-        "present_tags": present,
-        "missing_tags": missing,
-        "raw_tags": tags,
-    }
\ No newline at end of file
+        _log_region_result(result, account_name, region)
+
+    except ClientError as e:
+        error_msg = f"AWS API error in {region}: {e}"
+        logger.error(error_msg)
+        result["errors"].append(error_msg)
+    except Exception as e:
+        error_msg = f"Unexpected error in {region}: {e}"
+        logger.error(error_msg, exc_info=True)
+        result["errors"].append(error_msg)
+
+    return result
@@ -4,29 +4,106 @@ Exports tag compliance metrics in Prometheus format with labels for
 account, region, tag name, resource type, and ARN.
 """
 import logging
-from typing import Any, Dict
+import time
+from collections import Counter
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
 from fastapi import Response
-from prometheus_client import CONTENT_TYPE_LATEST, Gauge, generate_latest
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Gauge,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from src.aws_audit import ResourceRecord
 
 logger = logging.getLogger(__name__)
 
+# Default cap on tag_missing_detail series per (account, region)
+DEFAULT_DETAIL_CARDINALITY_LIMIT = 10000
+
+# Compliance metrics only change in update_metrics(), so their exposition is
+# rendered once per update; the default registry (process/GC metrics) is
+# rendered per scrape
+COMPLIANCE_REGISTRY = CollectorRegistry()
+_metrics_version = 0
+_rendered: Tuple[int, bytes] = (-1, b"")
+
+
+class SnapshotGauge:
+    """Gauge family served from a snapshot that each update replaces whole.
+
+    For high-cardinality series rebuilt on every refresh: samples are plain
+    (label values, value) entries instead of Gauge children, and scrapes see
+    either the previous or the new snapshot, never a partial one. Label values
+    must be strings, in labelnames order; labelnames include account_id and
+    region.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self._name = name
+        self._documentation = documentation
+        self._labelnames = tuple(labelnames)
+        self._account_index = self._labelnames.index("account_id")
+        self._region_index = self._labelnames.index("region")
+        self._samples: Dict[Tuple[str, ...], float] = {}
+        self._pending: Optional[Dict[Tuple[str, ...], float]] = None
+        COMPLIANCE_REGISTRY.register(self)
+
+    def begin(self):
+        """Start collecting a new snapshot."""
+        self._pending = {}
+
+    def set(self, labelvalues: Tuple[str, ...], value: float):
+        """Set sample in the snapshot being collected."""
+        self._pending[labelvalues] = value
+
+    def publish(self, skipped: FrozenSet[Tuple[str, str]] = frozenset()):
+        """Replace the exported snapshot with the collected one.
+
+        Samples of skipped (account_id, region) pairs (not updated this time)
+        are carried over from the previous snapshot.
+        """
+        pending = self._pending
+        if skipped:
+            account_index, region_index = self._account_index, self._region_index
+            for labelvalues, value in self._samples.items():
+                if (labelvalues[account_index], labelvalues[region_index]) in skipped:
+                    pending[labelvalues] = value
+        self._samples = pending
+        self._pending = None
+
+    def describe(self):
+        return [GaugeMetricFamily(self._name, self._documentation, labels=self._labelnames)]
+
+    def collect(self):
+        family = GaugeMetricFamily(self._name, self._documentation, labels=self._labelnames)
+        for labelvalues, value in self._samples.items():
+            family.add_metric(labelvalues, value)
+        return [family]
+
+
 # Prometheus metric definitions
 TAG_COMPLIANT = Gauge(
     "tag_compliant_total",
     "Resources compliant with required tag",
     ["tag", "account_name", "account_id", "region"],
+    registry=COMPLIANCE_REGISTRY,
 )
 
 TAG_NON_COMPLIANT = Gauge(
     "tag_non_compliant_total",
     "Resources missing required tag",
     ["tag", "account_name", "account_id", "region"],
+    registry=COMPLIANCE_REGISTRY,
 )
 
-TAG_MISSING_DETAIL = Gauge(
+TAG_MISSING_DETAIL = SnapshotGauge(
     "tag_missing_detail",
-    "Detailed missing tag indicator (1 per resource/tag combination)",
+    "Detailed missing tag indicator (1 per resource/tag combination, "
+    "capped per account/region; totals are in tag_non_compliant_total)",
     ["tag", "account_name", "account_id", "region", "resource_type", "resource_arn"],
 )
 
@@ -34,22 +111,24 @@ RESOURCES_SCANNED = Gauge(
     "resources_scanned_total",
     "Total resources scanned",
     ["account_name", "account_id", "region"],
+    registry=COMPLIANCE_REGISTRY,
 )
 
 COMPLIANCE_PERCENTAGE = Gauge(
     "compliance_percentage",
     "Overall tag compliance percentage",
     ["account_name", "account_id", "region"],
+    registry=COMPLIANCE_REGISTRY,
 )
 
 # New compliance percentage metrics
-TAG_COMPLIANCE_PERCENTAGE = Gauge(
+TAG_COMPLIANCE_PERCENTAGE = SnapshotGauge(
     "tag_compliance_percentage",
     "Compliance percentage per individual tag",
     ["tag", "account_name", "account_id", "region"],
 )
 
-TAG_RESOURCE_TYPE_COMPLIANCE_PERCENTAGE = Gauge(
+TAG_RESOURCE_TYPE_COMPLIANCE_PERCENTAGE = SnapshotGauge(
     "tag_resource_type_compliance_percentage",
     "Compliance percentage per tag and resource type",
     ["tag", "resource_type", "account_name", "account_id", "region"],
@@ -59,251 +138,285 @@ RESOURCES_FULLY_COMPLIANT = Gauge(
     "resources_fully_compliant_total",
     "Resources with all required tags present",
     ["account_name", "account_id", "region"],
+    registry=COMPLIANCE_REGISTRY,
 )
 
 RESOURCES_FULLY_COMPLIANT_BY_TYPE = Gauge(
     "resources_fully_compliant_by_type_total",
     "Fully compliant resources grouped by resource type",
     ["resource_type", "account_name", "account_id", "region"],
+    registry=COMPLIANCE_REGISTRY,
 )
 
 RESOURCES_FULLY_COMPLIANT_BY_TYPE_PERCENTAGE = Gauge(
     "resources_fully_compliant_by_type_percentage",
     "Percentage of fully compliant resources by resource type",
     ["resource_type", "account_name", "account_id", "region"],
+    registry=COMPLIANCE_REGISTRY,
 )
 
+# Carried forward with the other series of a skipped account/region, so its
+# age tells fresh values from ones kept after a failed scan
+LAST_SUCCESSFUL_SCAN = Gauge(
+    "last_successful_scan_timestamp_seconds",
+    "Unix time of the last update from an error-free scan of the account/region",
+    ["account_name", "account_id", "region"],
+    registry=COMPLIANCE_REGISTRY,
+)
 
-def update_metrics(compliance_data: Dict[str, Any]):
+
+# Regular gauges are pruned to the series set by the latest update (plus
+# those of account/regions skipped on error) instead of being cleared up front
+_TRACKED_GAUGES = (
+    LAST_SUCCESSFUL_SCAN,
+    TAG_COMPLIANT,
+    TAG_NON_COMPLIANT,
+    RESOURCES_SCANNED,
+    COMPLIANCE_PERCENTAGE,
+    RESOURCES_FULLY_COMPLIANT,
+    RESOURCES_FULLY_COMPLIANT_BY_TYPE,
+    RESOURCES_FULLY_COMPLIANT_BY_TYPE_PERCENTAGE,
+)
+_known_series: Dict[Gauge, Set[Tuple[str, ...]]] = {gauge: set() for gauge in _TRACKED_GAUGES}
+_updated_series: Dict[Gauge, Set[Tuple[str, ...]]] = {gauge: set() for gauge in _TRACKED_GAUGES}
+
+
+def _labels(gauge: Gauge, *labelvalues: str):
+    """Get gauge child (labels in declaration order), recording its series."""
+    _updated_series[gauge].add(labelvalues)
+    return gauge.labels(*labelvalues)
+
+
+def _known_regions(account_id: str) -> Set[Tuple[str, str]]:
+    """(account_id, region) pairs the account currently has series for."""
+    return {
+        (account, region) for _, account, region in _known_series[LAST_SUCCESSFUL_SCAN]
+        if account == account_id
+    }
+
+
+def _remove_stale_series(skipped: Set[Tuple[str, str]]):
+    """Remove series not set by this update, keeping skipped account/regions' series."""
+    for gauge in _TRACKED_GAUGES:
+        updated = _updated_series[gauge]
+        account_index = gauge._labelnames.index("account_id")
+        region_index = gauge._labelnames.index("region")
+        for labelvalues in _known_series[gauge] - updated:
+            if (labelvalues[account_index], labelvalues[region_index]) in skipped:
+                updated.add(labelvalues)
+            else:
+                gauge.remove(*labelvalues)
+        _known_series[gauge] = updated
+        _updated_series[gauge] = set()
+
+
+def update_metrics(
+    compliance_data: Dict[str, Any],
+    detail_limit: Optional[int] = DEFAULT_DETAIL_CARDINALITY_LIMIT
+):
     """Update Prometheus metrics from compliance scan results.
 
     Args:
         compliance_data: Dict[account_id -> {account_name, regions -> scan_results}]
+        detail_limit: Max tag_missing_detail series per account/region (None = unlimited)
     """
     logger.info("Updating Prometheus metrics")
-
-    # Clear detail metrics to avoid stale data
-    TAG_MISSING_DETAIL.clear()
-    TAG_COMPLIANCE_PERCENTAGE.clear()
-    TAG_RESOURCE_TYPE_COMPLIANCE_PERCENTAGE.clear()
-    RESOURCES_FULLY_COMPLIANT_BY_TYPE.clear()
-    RESOURCES_FULLY_COMPLIANT_BY_TYPE_PERCENTAGE.clear()
+    updated_at = time.time()
+
+    # Rebuild snapshot metrics from scratch; regular gauges are pruned after.
+    # Both keep the previous series of account/regions whose scan failed: an
+    # account without credentials, or a region with errors (possibly partial
+    # counts), is skipped rather than reported as empty.
+    snapshots = (
+        TAG_MISSING_DETAIL, TAG_COMPLIANCE_PERCENTAGE, TAG_RESOURCE_TYPE_COMPLIANCE_PERCENTAGE
+    )
+    for snapshot in snapshots:
+        snapshot.begin()
+    for updated in _updated_series.values():
+        updated.clear()
+    skipped = set()
 
     for account_id, acct in compliance_data.items():
+        # Snapshot samples take label values as-is; YAML may yield int IDs
+        account_id = str(account_id)
+
         if "error" in acct:
             logger.warning("Skipping account %s: %s", account_id, acct["error"])
+            skipped |= _known_regions(account_id)
             continue
 
-        acct_name = acct.get("account_name", account_id)
+        acct_name = str(acct.get("account_name", account_id))
 
         for region, data in acct.get("regions", {}).items():
-            _update_region_metrics(account_id, acct_name, region, data)
+            region = str(region)
+            if data.get("errors"):
+                logger.warning(
+                    "Skipping %s/%s: %s", account_id, region, "; ".join(data["errors"])
+                )
+                skipped.add((account_id, region))
+                continue
+            _update_region_metrics(account_id, acct_name, region, data, detail_limit)
+            _labels(LAST_SUCCESSFUL_SCAN, acct_name, account_id, region).set(updated_at)
+
+    _remove_stale_series(skipped)
+    for snapshot in snapshots:
+        snapshot.publish(frozenset(skipped))
+    _invalidate_rendered()
 
     logger.info("Metrics updated")
 
 
-def _update_region_metrics(account_id: str, acct_name: str, region: str, data: Dict[str, Any]):
-    """Update metrics for single region."""
+def _update_region_metrics(
+    account_id: str,
+    acct_name: str,
+    region: str,
+    data: Dict[str, Any],
+    detail_limit: Optional[int] = DEFAULT_DETAIL_CARDINALITY_LIMIT
+):
+    """Update metrics for single region.
+
+    Counts arrive precomputed by the scan (see _new_region_result in
+    aws_audit); non-compliant records are only iterated for the per-resource
+    detail metric.
+    """
     total = data.get("total", 0)
-    compliant = data.get("compliant", [])
+    compliant_count = data.get("compliant_count", 0)
     non_compliant = data.get("non_compliant", [])
 
-    RESOURCES_SCANNED.labels(
-        account_name=acct_name, account_id=account_id, region=region
-    ).set(total)
-
-    compliance_pct = (len(compliant) / total * 100) if total > 0 else 0
-    COMPLIANCE_PERCENTAGE.labels(
-        account_name=acct_name, account_id=account_id, region=region
-    ).set(compliance_pct)
-
-    tag_compliant_counts = {}
-    tag_missing_counts = {}
+    _labels(RESOURCES_SCANNED, acct_name, account_id, region).set(total)
 
-    # Aggregate tag-level metrics
-    for rec in non_compliant:
-        _process_non_compliant_resource(
-            rec, acct_name, account_id, region, tag_compliant_counts, tag_missing_counts
-        )
+    compliance_pct = (compliant_count / total * 100) if total > 0 else 0
+    _labels(COMPLIANCE_PERCENTAGE, acct_name, account_id, region).set(compliance_pct)
 
-    for rec in compliant:
-        for tag in rec.get("present_tags", []):
-            key = (tag, acct_name, account_id, region)
-            tag_compliant_counts[key] = tag_compliant_counts.get(key, 0) + 1
+    _set_missing_detail(non_compliant, acct_name, account_id, region, detail_limit)
 
     # Update basic gauges
-    for (tag, acct_name, account_id, region), count in tag_compliant_counts.items():
-        TAG_COMPLIANT.labels(
-            tag=tag, account_name=acct_name, account_id=account_id, region=region
-        ).set(count)
+    for tag, count in data.get("tag_present_counts", {}).items():
+        _labels(TAG_COMPLIANT, tag, acct_name, account_id, region).set(count)
 
-    for (tag, acct_name, account_id, region), count in tag_missing_counts.items():
-        TAG_NON_COMPLIANT.labels(
-            tag=tag, account_name=acct_name, account_id=account_id, region=region
-        ).set(count)
+    for tag, count in data.get("tag_missing_counts", {}).items():
+        _labels(TAG_NON_COMPLIANT, tag, acct_name, account_id, region).set(count)
 
     # Calculate and update new compliance metrics
-    _update_advanced_compliance_metrics(
-        compliant, non_compliant, acct_name, account_id, region
-    )
+    _update_advanced_compliance_metrics(data, acct_name, account_id, region)
 
 
-def _process_non_compliant_resource(
-    rec: Dict[str, Any],
+def _set_missing_detail(
+    non_compliant: List[ResourceRecord],
     acct_name: str,
     account_id: str,
     region: str,
-    tag_compliant_counts: Dict,
-    tag_missing_counts: Dict
+    limit: Optional[int] = DEFAULT_DETAIL_CARDINALITY_LIMIT
 ):
-    """Process non-compliant resource for metrics."""
-    missing_tags = rec.get("missing_tags", [])
-    present_tags = rec.get("present_tags", [])
-    resource_arn = rec.get("resource_arn", "")
-    resource_type = rec.get("resource_type", "unknown")
-
-    for tag in missing_tags:
-        key = (tag, acct_name, account_id, region)
-        tag_missing_counts[key] = tag_missing_counts.get(key, 0) + 1
-
-        # Detailed metric per resource (truncate ARN to avoid cardinality explosion)
-        arn_label = resource_arn[:200] if len(resource_arn) > 200 else resource_arn
-        try:
-            TAG_MISSING_DETAIL.labels(
-                tag=tag,
-                account_name=acct_name,
-                account_id=account_id,
-                region=region,
-                resource_type=resource_type,
-                resource_arn=arn_label
-            ).set(1)
-        except Exception as e:
-            logger.warning("Failed to set detail metric for %s: %s", arn_label, e)
-
-    for tag in present_tags:
-        key = (tag, acct_name, account_id, region)
-        tag_compliant_counts[key] = tag_compliant_counts.get(key, 0) + 1
+    """Set the per-resource missing-tag detail metric for one region.
+
+    Stops at limit series (whole resources only); aggregated counts still
+    cover every resource.
+    """
+    set_detail = TAG_MISSING_DETAIL.set
+    series = 0
+    for rec in non_compliant:
+        if limit is not None:
+            series += len(rec.missing_tags)
+            if series > limit:
+                logger.warning(
+                    "tag_missing_detail capped at %d series for %s/%s",
+                    limit, account_id, region
+                )
+                break
+        resource_type = rec.resource_type
+        # Truncate ARN to avoid cardinality explosion
+        arn_label = rec.resource_arn[:200]
+        for tag in rec.missing_tags:
+            set_detail((tag, acct_name, account_id, region, resource_type, arn_label), 1)
 
 
 def _update_advanced_compliance_metrics(
-    compliant: list,
-    non_compliant: list,
+    data: Dict[str, Any],
     acct_name: str,
     account_id: str,
     region: str
 ):
     """Calculate and update advanced compliance percentage metrics."""
-    all_resources = compliant + non_compliant
-    total_resources = len(all_resources)
+    total_resources = data.get("total", 0)
 
     if total_resources == 0:
         return
 
+    compliant_by_type = data.get("compliant_by_type", {})
+    tag_present_counts = data.get("tag_present_counts", {})
+
     # Track fully compliant resources
-    fully_compliant_count = len(compliant)
-    RESOURCES_FULLY_COMPLIANT.labels(
-        account_name=acct_name, account_id=account_id, region=region
-    ).set(fully_compliant_count)
+    _labels(RESOURCES_FULLY_COMPLIANT, acct_name, account_id, region).set(
+        data.get("compliant_count", 0)
+    )
 
     # Track compliance by resource type (fully compliant)
-    type_compliant_counts = {}
-    type_total_counts = {}
-
-    for rec in compliant:
-        resource_type = rec.get("resource_type", "unknown")
-        key = (resource_type, acct_name, account_id, region)
-        type_compliant_counts[key] = type_compliant_counts.get(key, 0) + 1
-        type_total_counts[key] = type_total_counts.get(key, 0) + 1
-
-    for rec in non_compliant:
-        resource_type = rec.get("resource_type", "unknown")
-        key = (resource_type, acct_name, account_id, region)
-        type_total_counts[key] = type_total_counts.get(key, 0) + 1
+    type_total_counts = Counter(compliant_by_type)
+    type_total_counts.update(data.get("non_compliant_by_type", {}))
 
     # Set absolute counts
-    for (resource_type, acct_name, account_id, region), count in type_compliant_counts.items():
-        RESOURCES_FULLY_COMPLIANT_BY_TYPE.labels(
-            resource_type=resource_type,
-            account_name=acct_name,
-            account_id=account_id,
-            region=region
+    for resource_type, count in compliant_by_type.items():
+        _labels(
+            RESOURCES_FULLY_COMPLIANT_BY_TYPE, resource_type, acct_name, account_id, region
         ).set(count)
 
     # Calculate and set percentages
-    for key, total_count in type_total_counts.items():
-        compliant_count = type_compliant_counts.get(key, 0)
+    for resource_type, total_count in type_total_counts.items():
+        compliant_count = compliant_by_type.get(resource_type, 0)
         percentage = (compliant_count / total_count * 100) if total_count > 0 else 0
 
-        resource_type, acct_name, account_id, region = key
-        RESOURCES_FULLY_COMPLIANT_BY_TYPE_PERCENTAGE.labels(
-            resource_type=resource_type,
-            account_name=acct_name,
-            account_id=account_id,
-            region=region
+        _labels(
+            RESOURCES_FULLY_COMPLIANT_BY_TYPE_PERCENTAGE,
+            resource_type, acct_name, account_id, region
         ).set(percentage)
 
-    # Calculate per-tag compliance percentage
-    tag_total_counts = {}
-    tag_compliant_counts = {}
-
-    for rec in all_resources:
-        present_tags = rec.get("present_tags", [])
-        missing_tags = rec.get("missing_tags", [])
-        all_tags = set(present_tags + missing_tags)
-
-        for tag in all_tags:
-            key = (tag, acct_name, account_id, region)
-            tag_total_counts[key] = tag_total_counts.get(key, 0) + 1
-            if tag in present_tags:
-                tag_compliant_counts[key] = tag_compliant_counts.get(key, 0) + 1
-
-    # Set per-tag compliance percentage
-    for key in tag_total_counts:
-        compliant_count = tag_compliant_counts.get(key, 0)
-        total_count = tag_total_counts[key]
-        percentage = (compliant_count / total_count * 100) if total_count > 0 else 0
+    # Every resource is checked against every required tag, so per-tag totals
+    # equal the resource totals; non-compliant resources add per-type detail
+    tags = set(tag_present_counts).union(data.get("tag_missing_counts", ()))
+    tag_type_present_counts = data.get("tag_type_present_counts", Counter())
 
-        tag, acct_name, account_id, region = key
-        TAG_COMPLIANCE_PERCENTAGE.labels(
-            tag=tag, account_name=acct_name, account_id=account_id, region=region
-        ).set(percentage)
+    for tag in tags:
+        # Per-tag compliance percentage
+        percentage = tag_present_counts.get(tag, 0) / total_resources * 100
+        TAG_COMPLIANCE_PERCENTAGE.set((tag, acct_name, account_id, region), percentage)
 
-    # Calculate per-tag per-resource-type compliance percentage
-    tag_type_total_counts = {}
-    tag_type_compliant_counts = {}
-
-    for rec in all_resources:
-        resource_type = rec.get("resource_type", "unknown")
-        present_tags = rec.get("present_tags", [])
-        missing_tags = rec.get("missing_tags", [])
-        all_tags = set(present_tags + missing_tags)
-
-        for tag in all_tags:
-            key = (tag, resource_type, acct_name, account_id, region)
-            tag_type_total_counts[key] = tag_type_total_counts.get(key, 0) + 1
-            if tag in present_tags:
-                tag_type_compliant_counts[key] = tag_type_compliant_counts.get(key, 0) + 1
-
-    # Set per-tag per-resource-type compliance percentage
-    for key in tag_type_total_counts:
-        compliant_count = tag_type_compliant_counts.get(key, 0)
-        total_count = tag_type_total_counts[key]
-        percentage = (compliant_count / total_count * 100) if total_count > 0 else 0
+        # Per-tag per-resource-type compliance percentage
+        for resource_type, total_count in type_total_counts.items():
+            compliant_count = (
+                compliant_by_type.get(resource_type, 0)
+                + tag_type_present_counts[tag, resource_type]
+            )
+            percentage = (compliant_count / total_count * 100) if total_count > 0 else 0
 
-        tag, resource_type, acct_name, account_id, region = key
-        TAG_RESOURCE_TYPE_COMPLIANCE_PERCENTAGE.labels(
-            tag=tag,
-            resource_type=resource_type,
-            account_name=acct_name,
-            account_id=account_id,
-            region=region
-        ).set(percentage)
+            TAG_RESOURCE_TYPE_COMPLIANCE_PERCENTAGE.set(
+                (tag, resource_type, acct_name, account_id, region), percentage
+            )
+
+
+def _invalidate_rendered():
+    """Mark the rendered compliance exposition stale."""
+    global _metrics_version
+    _metrics_version += 1
+
+
+def _render_compliance_metrics() -> bytes:
+    """Compliance exposition, rendered at most once per metrics update."""
+    global _rendered
+    version = _metrics_version
+    rendered_version, body = _rendered
+    if rendered_version != version:
+        body = generate_latest(COMPLIANCE_REGISTRY)
+        # Tagged with the version read before rendering, so an update that
+        # lands mid-render is picked up on the next scrape
+        _rendered = (version, body)
+    return body
 
 
 def expose_prometheus_metrics() -> Response:
     """Generate Prometheus metrics response."""
     try:
-        data = generate_latest()
+        data = generate_latest() + _render_compliance_metrics()
         return Response(content=data, media_type=CONTENT_TYPE_LATEST)
     except Exception as e:
         logger.error("Failed to generate metrics: %s", e, exc_info=True)
@@ -6,28 +6,54 @@ and exposes Prometheus metrics via HTTP endpoint.
 import asyncio
 import logging
 import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Set
 
 from fastapi import FastAPI, Response
 from fastapi.responses import PlainTextResponse
 
-from src.aws_audit import validate_resource_tags
-from src.metrics import update_metrics, expose_prometheus_metrics
+from src.aws_audit import (
+    DEFAULT_ASYNC_CONCURRENCY,
+    DEFAULT_MAX_WORKERS,
+    validate_resource_tags,
+    validate_resource_tags_async,
+)
+from src.metrics import (
+    DEFAULT_DETAIL_CARDINALITY_LIMIT,
+    expose_prometheus_metrics,
+    update_metrics,
+)
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True, slots=True)
+class ScanState:
+    """Outcome of the latest scans, replaced whole so readers never see a mix."""
+
+    # ISO timestamp of the last successful scan (None until the first one)
+    last_scan_iso: Optional[str] = None
+    # time.monotonic() of the last successful scan, for elapsed-time reporting
+    last_scan_monotonic: float = 0.0
+    # Error of the latest scan, None if it succeeded
+    last_error: Optional[str] = None
+
+
 # Global state
 app = FastAPI(title="AWS Tag Compliance Exporter", version="1.0.0")
-_last_scan_time: Optional[datetime] = None
-_last_scan_error: Optional[str] = None
-_scan_in_progress: bool = False
+_state = ScanState()
+_scan_lock = asyncio.Lock()
 _shutdown_event = asyncio.Event()
 
 
 class MetricsRefreshManager:
     """Manages background metrics refresh task."""
 
+    __slots__ = ("config", "refresh_interval", "task", "_manual_scans", "_executor")
+
     def __init__(
         self,
         config: dict,
@@ -36,6 +62,11 @@ class MetricsRefreshManager:
         self.config = config
         self.refresh_interval = refresh_interval_seconds
         self.task: Optional[asyncio.Task] = None
+        self._manual_scans: Set[asyncio.Task] = set()
+        # Scans never overlap; validate_resource_tags fans out on its own pool.
+        # A dedicated thread keeps blocking scan/metrics work off the loop's
+        # default executor.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aws-scan")
 
     def start(self):
         """Start background refresh task."""
@@ -52,11 +83,16 @@ class MetricsRefreshManager:
             except asyncio.CancelledError:
                 pass
             logger.info("Metrics refresh task stopped")
+        if self._manual_scans:
+            manual_scans = list(self._manual_scans)
+            for task in manual_scans:
+                task.cancel()
+            await asyncio.gather(*manual_scans, return_exceptions=True)
+            logger.info("On-demand scans stopped")
+        self._executor.shutdown(wait=False)
 
     async def _refresh_loop(self):
         """Background loop to periodically refresh metrics."""
-        global _last_scan_time, _last_scan_error, _scan_in_progress
-
         # Run initial scan immediately
         await self._run_scan()
 
@@ -72,18 +108,50 @@ class MetricsRefreshManager:
                 await self._run_scan()
 
     async def _run_scan(self):
-        """Execute AWS scan and update metrics."""
-        global _last_scan_time, _last_scan_error, _scan_in_progress
-
-        if _scan_in_progress:
+        """Execute AWS scan and update metrics, unless one is already running."""
+        if _scan_lock.locked():
             logger.warning("Scan already in progress, skipping this cycle")
             return
 
-        _scan_in_progress = True
-        scan_start = datetime.now()
+        # Uncontended here: no await between the check and the acquire
+        await _scan_lock.acquire()
+        try:
+            await self._scan()
+        finally:
+            _scan_lock.release()
+
+    async def trigger_scan(self) -> bool:
+        """Start an on-demand scan in the background.
+
+        The scan lock is taken before returning, so concurrent triggers cannot
+        both start a scan. Returns False if a scan is already in progress.
+        """
+        if _scan_lock.locked():
+            return False
+
+        # Does not suspend: the lock is free and nothing else runs in between
+        await _scan_lock.acquire()
+        task = asyncio.create_task(self._scan())
+        # Keep a reference until done so the task is not garbage collected;
+        # the callback also releases the lock if the task is cancelled early
+        self._manual_scans.add(task)
+        task.add_done_callback(self._manual_scan_done)
+        return True
+
+    def _manual_scan_done(self, task: asyncio.Task):
+        """Release the scan lock held by a finished on-demand scan."""
+        self._manual_scans.discard(task)
+        _scan_lock.release()
+
+    async def _scan(self):
+        """Execute AWS scan and update metrics (caller holds the scan lock)."""
+        global _state
+
+        scan_start = time.monotonic()
 
         try:
             logger.info("Starting AWS resource scan")
+            loop = asyncio.get_running_loop()
 
             # Extract config
             matrix = self.config.get('aws_account_matrix', [])
@@ -91,26 +159,44 @@ class MetricsRefreshManager:
             assume_template = self.config.get('assume_role_name_template')
             overrides = self.config.get('aws_account_overrides', {})
             excluded_types = self.config.get('excluded_resource_types', [])
-
-            # Run scan in executor to avoid blocking event loop
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                validate_resource_tags,
-                matrix,
-                required_tags,
-                assume_template,
-                overrides,
-                excluded_types
+            keep_records = self.config.get('keep_records_in_memory', False)
+            type_filters = self.config.get('resource_type_filters', [])
+            max_workers = self.config.get('max_workers', DEFAULT_MAX_WORKERS)
+            detail_limit = self.config.get(
+                'detail_cardinality_limit', DEFAULT_DETAIL_CARDINALITY_LIMIT
+            )
+            async_concurrency = self.config.get(
+                'async_max_concurrency', DEFAULT_ASYNC_CONCURRENCY
             )
 
-            # Update metrics
-            update_metrics(results)
+            if self.config.get('async_scan', False):
+                results = await validate_resource_tags_async(
+                    matrix, required_tags, assume_template, overrides, excluded_types,
+                    keep_records=keep_records, resource_type_filters=type_filters,
+                    max_concurrency=async_concurrency
+                )
+            else:
+                # Run scan in executor to avoid blocking event loop
+                results = await loop.run_in_executor(
+                    self._executor,
+                    validate_resource_tags,
+                    matrix,
+                    required_tags,
+                    assume_template,
+                    overrides,
+                    excluded_types,
+                    max_workers,
+                    keep_records,
+                    type_filters
+                )
 
-            _last_scan_time = datetime.now()
-            _last_scan_error = None
+            # Update metrics (off the loop: proportional to non-compliant records)
+            await loop.run_in_executor(self._executor, update_metrics, results, detail_limit)
 
-            scan_duration = (datetime.now() - scan_start).total_seconds()
+            scan_end = time.monotonic()
+            _state = ScanState(datetime.now().isoformat(), scan_end)
+
+            scan_duration = scan_end - scan_start
             logger.info(
                 "Scan completed successfully in %.2fs. Next scan in %ds",
                 scan_duration,
@@ -118,12 +204,24 @@ class MetricsRefreshManager:
             )
 
         except Exception as e:
-            _last_scan_error = str(e)
+            _state = replace(_state, last_error=str(e))
             logger.error("Scan failed: %s", e, exc_info=True)
 
-        finally:
-            _scan_in_progress = False
 
+# Static part of the root endpoint body
+_ROOT_HEADER = "\n".join([
+    "AWS Tag Compliance Exporter - Web Mode",
+    "=" * 50,
+    "",
+    "Endpoints:",
+    "  GET /metrics  - Prometheus metrics",
+    "  GET /health   - Health check (liveness)",
+    "  GET /ready    - Readiness check",
+    "  POST /scan    - Trigger a scan now",
+    "",
+    "Status:",
+    "",
+])
 
 # Global refresh manager (initialized in startup)
 _refresh_manager: Optional[MetricsRefreshManager] = None
@@ -164,19 +262,19 @@ async def health_endpoint():
         200 OK if service is healthy
         503 Service Unavailable if last scan failed
     """
-    global _last_scan_time, _last_scan_error
+    state = _state
 
-    if _last_scan_error:
+    if state.last_error:
         return Response(
-            content=f"Unhealthy: Last scan failed - {_last_scan_error}",
+            content=f"Unhealthy: Last scan failed - {state.last_error}",
             status_code=503,
             media_type="text/plain"
         )
 
-    if _last_scan_time:
-        uptime = (datetime.now() - _last_scan_time).total_seconds()
+    if state.last_scan_iso:
+        uptime = time.monotonic() - state.last_scan_monotonic
         return PlainTextResponse(
-            f"OK - Last scan: {_last_scan_time.isoformat()} ({uptime:.0f}s ago)"
+            f"OK - Last scan: {state.last_scan_iso} ({uptime:.0f}s ago)"
         )
 
     return PlainTextResponse("OK - Initializing")
@@ -190,9 +288,7 @@ async def readiness_endpoint():
         200 OK if at least one successful scan has completed
         503 Service Unavailable if no successful scan yet
     """
-    global _last_scan_time
-
-    if _last_scan_time is None:
+    if _state.last_scan_iso is None:
         return Response(
             content="Not ready: No successful scan yet",
             status_code=503,
@@ -202,37 +298,51 @@ async def readiness_endpoint():
     return PlainTextResponse("Ready")
 
 
+@app.post("/scan", response_class=PlainTextResponse)
+async def scan_endpoint():
+    """Trigger an on-demand scan.
+
+    Returns:
+        202 Accepted if a scan was started
+        409 Conflict if a scan is already in progress
+        503 Service Unavailable if the refresh manager is not running
+    """
+    if _refresh_manager is None:
+        return Response(
+            content="Scan unavailable: refresh manager not running",
+            status_code=503,
+            media_type="text/plain"
+        )
+
+    if not await _refresh_manager.trigger_scan():
+        return Response(
+            content="Scan already in progress",
+            status_code=409,
+            media_type="text/plain"
+        )
+
+    return PlainTextResponse("Scan started", status_code=202)
+
+
 @app.get("/", response_class=PlainTextResponse)
 async def root_endpoint():
     """Root endpoint with service information."""
-    global _last_scan_time, _last_scan_error, _scan_in_progress
-
-    status_lines = [
-        "AWS Tag Compliance Exporter - Web Mode",
-        "=" * 50,
-        "",
-        "Endpoints:",
-        "  GET /metrics  - Prometheus metrics",
-        "  GET /health   - Health check (liveness)",
-        "  GET /ready    - Readiness check",
-        "",
-        "Status:",
-    ]
-
-    if _scan_in_progress:
-        status_lines.append("  Scan: IN PROGRESS")
-    elif _last_scan_time:
-        uptime = (datetime.now() - _last_scan_time).total_seconds()
-        status_lines.append(f"  Last scan: {_last_scan_time.isoformat()} ({uptime:.0f}s ago)")
+    state = _state
+
+    if _scan_lock.locked():
+        scan_line = "  Scan: IN PROGRESS"
+    elif state.last_scan_iso:
+        uptime = time.monotonic() - state.last_scan_monotonic
+        scan_line = f"  Last scan: {state.last_scan_iso} ({uptime:.0f}s ago)"
     else:
-        status_lines.append("  Last scan: Never")
+        scan_line = "  Last scan: Never"
 
-    if _last_scan_error:
-        status_lines.append(f"  Last error: {_last_scan_error}")
+    if state.last_error:
+        status_line = f"  Last error: {state.last_error}"
     else:
-        status_lines.append("  Status: OK")
+        status_line = "  Status: OK"
 
-    return PlainTextResponse("\n".join(status_lines))
+    return PlainTextResponse(f"{_ROOT_HEADER}{scan_line}\n{status_line}")
 
 
 def run_web_server(
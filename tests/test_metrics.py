@@ -0,0 +1,130 @@
+"""Tests for Prometheus metrics updates."""
+import logging
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.aws_audit import (
+    ResourceRecord,
+    _new_region_result,
+    _process_page,
+    _required_tag_names,
+)
+from src.metrics import COMPLIANCE_REGISTRY, expose_prometheus_metrics, update_metrics
+
+ACCOUNT = "111111111111"
+REGION = "us-east-1"
+
+
+def _region_result():
+    """One compliant bucket and one instance missing "owner"."""
+    result = _new_region_result()
+    result["non_compliant"].append(ResourceRecord(
+        ACCOUNT, "prod", REGION, "arn:aws:ec2:us-east-1:111111111111:instance/i-1",
+        "instance", "ec2", ["env"], ["owner"]
+    ))
+    result["total"] = 2
+    result["compliant_count"] = 1
+    result["non_compliant_count"] = 1
+    result["compliant_by_type"]["bucket"] = 1
+    result["non_compliant_by_type"]["instance"] = 1
+    result["tag_present_counts"].update({"env": 2, "owner": 1})
+    result["tag_missing_counts"]["owner"] = 1
+    result["tag_type_present_counts"]["env", "instance"] = 1
+    return result
+
+
+def _sample(name, **labels):
+    labels.setdefault("account_id", ACCOUNT)
+    labels.setdefault("account_name", "prod")
+    labels.setdefault("region", REGION)
+    return COMPLIANCE_REGISTRY.get_sample_value(name, labels)
+
+
+# One series per kind of metric: regular gauges and snapshot families
+SERIES = [
+    ("last_successful_scan_timestamp_seconds", {}),
+    ("tag_compliant_total", {"tag": "owner"}),
+    ("resources_fully_compliant_by_type_total", {"resource_type": "bucket"}),
+    ("tag_compliance_percentage", {"tag": "owner"}),
+    ("tag_resource_type_compliance_percentage", {"tag": "env", "resource_type": "instance"}),
+    ("tag_missing_detail", {
+        "tag": "owner", "resource_type": "instance",
+        "resource_arn": "arn:aws:ec2:us-east-1:111111111111:instance/i-1",
+    }),
+]
+
+
+class SkippedScanTest(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        update_metrics({ACCOUNT: {"account_name": "prod", "regions": {REGION: _region_result()}}})
+
+    def test_skipped_account_keeps_all_series(self):
+        before = {name: _sample(name, **labels) for name, labels in SERIES}
+        self.assertNotIn(None, before.values())
+
+        update_metrics({ACCOUNT: {
+            "account_name": "prod", "error": "Failed to obtain credentials", "regions": {}
+        }})
+
+        after = {name: _sample(name, **labels) for name, labels in SERIES}
+        self.assertEqual(before, after)
+
+    def test_failed_region_keeps_all_series(self):
+        before = {name: _sample(name, **labels) for name, labels in SERIES}
+
+        failed = _new_region_result()
+        failed["errors"].append("AWS API error in us-east-1: Throttling")
+        update_metrics({ACCOUNT: {"account_name": "prod", "regions": {
+            REGION: failed, "eu-west-1": _region_result(),
+        }}})
+
+        after = {name: _sample(name, **labels) for name, labels in SERIES}
+        self.assertEqual(before, after)
+        self.assertEqual(_sample("resources_scanned_total", region="eu-west-1"), 2)
+        self.assertGreaterEqual(
+            _sample("last_successful_scan_timestamp_seconds", region="eu-west-1"),
+            before["last_successful_scan_timestamp_seconds"]
+        )
+
+    def test_removed_account_drops_all_series(self):
+        update_metrics({})
+
+        for name, labels in SERIES:
+            self.assertIsNone(_sample(name, **labels), name)
+
+
+class NonStringTagTest(unittest.TestCase):
+
+    def tearDown(self):
+        update_metrics({})
+
+    def test_yaml_scalar_tag_names_export_as_strings(self):
+        # REQUIRED_TAGS: [2024, on] parses to int and bool
+        required = _required_tag_names([2024, True, 2024])
+        self.assertEqual(required, ("2024", "True"))
+
+        result = _new_region_result()
+        page = {"ResourceTagMappingList": [{
+            "ResourceARN": "arn:aws:s3:::bucket-1",
+            "Tags": [{"Key": "True", "Value": "x"}],
+        }]}
+        _process_page(result, page, 1, required, ACCOUNT, "prod", REGION, ())
+        update_metrics({ACCOUNT: {"account_name": "prod", "regions": {REGION: result}}})
+
+        self.assertEqual(expose_prometheus_metrics().status_code, 200)
+        self.assertEqual(_sample("tag_compliant_total", tag="True"), 1)
+        self.assertEqual(_sample("tag_compliance_percentage", tag="2024"), 0)
+        self.assertEqual(_sample(
+            "tag_missing_detail", tag="2024", resource_type="s3",
+            resource_arn="arn:aws:s3:::bucket-1"
+        ), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()